@@ -0,0 +1,71 @@
+"""
+Cleans the pipe-delimited sales file in a single streaming pass
+
+Applies the same checks as remove_incomplete_rows.py, remove_zero_quantity.py,
+remove_negative_price.py and remove_invalid_transactionid.py (in that order)
+without writing the intermediate files in between.
+"""
+
+import csv
+
+input_file = r'c:\Users\ADMIN\Downloads\sales_data_pipe_delimited.txt'
+output_file = r'c:\Users\ADMIN\Downloads\sales_data_cleaned_final.txt'
+removed_file = r'c:\Users\ADMIN\Downloads\sales_data_rejected.txt'
+
+buffer_size = 1 << 20
+
+
+def rejection_reason(row):
+    """
+    Returns why a data row fails cleaning, or None if it is valid
+    """
+    if len(row) < 8 or not row[6].strip() or not row[7].strip():
+        return 'Incomplete'
+
+    try:
+        if int(row[4]) <= 0:
+            return 'Quantity <= 0'
+    except ValueError:
+        return 'Invalid Quantity'
+
+    try:
+        if float(row[5].replace(',', '')) <= 0:
+            return 'UnitPrice <= 0'
+    except ValueError:
+        return 'Invalid UnitPrice'
+
+    if not row[0].strip().startswith('T'):
+        return 'Invalid TransactionID'
+
+    return None
+
+
+rows_kept = 0
+rows_removed = 0
+
+with open(input_file, 'r', encoding='utf-8', newline='', buffering=buffer_size) as infile, \
+     open(output_file, 'w', encoding='utf-8', newline='', buffering=buffer_size) as outfile, \
+     open(removed_file, 'w', encoding='utf-8', newline='', buffering=buffer_size) as removedfile:
+    reader = csv.reader(infile, delimiter='|')
+    writer = csv.writer(outfile, delimiter='|')
+
+    writer.writerow(next(reader))
+    removedfile.write("RowNumber|Reason|TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n")
+
+    for row_num, row in enumerate(reader, 2):
+        # Skip empty rows
+        if not row or all(field.strip() == '' for field in row):
+            continue
+
+        reason = rejection_reason(row)
+        if reason is None:
+            writer.writerow(row)
+            rows_kept += 1
+        else:
+            removedfile.write(f"{row_num}|{reason}|" + '|'.join(row) + '\n')
+            rows_removed += 1
+
+print(f"Valid rows kept: {rows_kept}")
+print(f"Rows removed: {rows_removed}")
+print(f"\nCleaned data saved to: {output_file}")
+print(f"Removed data saved to: {removed_file}")
@@ -6,6 +6,12 @@ import csv
 import json
 import os
 from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from fetch_all_products import fetch_all_products
 from create_product_mapping import create_product_mapping
 
@@ -79,6 +85,8 @@ def parse_sales_data_raw(filename):
 def validate_sales_transactions(transactions):
     """
     Validates sales transactions and filters out invalid ones
+
+    Missing Region or Date values on valid transactions are set to 'Unknown'.
     """
     valid = []
     invalid_count = 0
@@ -117,6 +125,11 @@ def validate_sales_transactions(transactions):
                 invalid_count += 1
                 continue
             
+            # Fill optional fields so downstream code can index directly
+            for field in ('Region', 'Date'):
+                if not transaction.get(field):
+                    transaction[field] = 'Unknown'
+            
             valid.append(transaction)
         
         except Exception as e:
@@ -210,20 +223,18 @@ def save_enriched_to_file(enriched_transactions, output_file):
             'API_Category', 'API_Brand', 'API_Rating', 'API_Price', 'API_Stock', 'API_Discount', 'API_Match'
         ]
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        def format_rows():
+            for tx in enriched_transactions:
+                values = [tx.get(col, '') for col in columns]
+                yield '|'.join(['' if value is None else str(value) for value in values]) + '\n'
+        
+        # 1 MiB buffer and one writelines call instead of a write per row
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             # Write header
             f.write('|'.join(columns) + '\n')
             
             # Write data
-            for tx in enriched_transactions:
-                row = []
-                for col in columns:
-                    value = tx.get(col, '')
-                    if value is None or value == '':
-                        value = ''
-                    row.append(str(value))
-                
-                f.write('|'.join(row) + '\n')
+            f.writelines(format_rows())
         
         file_size = os.path.getsize(output_file)
         print(f"[OK] Enriched data saved to: {output_file}")
@@ -241,6 +252,12 @@ def save_enriched_to_file(enriched_transactions, output_file):
 def save_enriched_to_json(enriched_transactions, output_file):
     """
     Saves enriched transactions to JSON
+
+    Uses orjson when it is installed, otherwise the stdlib json module.
+    The two do not write identical files: orjson writes non-ASCII text
+    as raw UTF-8 (stdlib escapes it, e.g. \\u00e9) and writes NaN as
+    null (stdlib writes the non-standard NaN token), so a NaN value
+    loads back as None from an orjson-written file.
     """
     try:
         # Ensure directory exists
@@ -248,8 +265,14 @@ def save_enriched_to_json(enriched_transactions, output_file):
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        with open(output_file, 'w') as f:
-            json.dump(enriched_transactions, f, indent=2)
+        if orjson is not None:
+            # orjson serializes straight to UTF-8 bytes in C
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(enriched_transactions, option=orjson.OPT_INDENT_2))
+        else:
+            # One-shot dumps avoids json.dump's many small chunked writes
+            with open(output_file, 'w') as f:
+                f.write(json.dumps(enriched_transactions, indent=2))
         
         file_size = os.path.getsize(output_file)
         print(f"[OK] Enriched data exported to JSON: {output_file}")
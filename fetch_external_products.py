@@ -4,6 +4,7 @@ Fetch product data from DummyJSON API and integrate with sales analysis
 
 import requests
 import json
+from heapq import nlargest
 
 
 def fetch_external_products():
@@ -140,11 +141,11 @@ def compare_with_sales_data(api_analysis, sales_products):
     print("TOP 10 BRANDS (by product count)")
     print("="*90)
     
-    sorted_brands = sorted(
+    sorted_brands = nlargest(
+        10,
         api_analysis['brands'].items(),
-        key=lambda x: x[1]['count'],
-        reverse=True
-    )[:10]
+        key=lambda x: x[1]['count']
+    )
     
     print(f"\n{'Brand':<30} {'Product Count':<15}")
     print("-"*90)
@@ -191,9 +192,7 @@ Price Insights:
 
 # Main execution
 if __name__ == "__main__":
-    from read_sales_data import read_sales_data
-    from parse_transactions import parse_transactions
-    from top_selling_products import top_selling_products
+    from sales_pipeline import top_sales
     
     try:
         # Fetch external data
@@ -205,9 +204,7 @@ if __name__ == "__main__":
             
             # Load sales data for comparison
             filename = r'c:\Users\ADMIN\Downloads\sales_data_cleaned_final.txt'
-            raw_lines = read_sales_data(filename)
-            transactions = parse_transactions(raw_lines)
-            sales_products = top_selling_products(transactions, n=1000)
+            sales_products = top_sales(filename, n=1000)
             
             # Compare
             compare_with_sales_data(api_analysis, sales_products)
@@ -173,9 +173,7 @@ def export_product_data(products, filename):
 
 # Main execution
 if __name__ == "__main__":
-    from read_sales_data import read_sales_data
-    from parse_transactions import parse_transactions
-    from top_selling_products import top_selling_products
+    from sales_pipeline import top_sales
     
     try:
         print("="*90)
@@ -191,9 +189,7 @@ if __name__ == "__main__":
             
             # Load sales data for comparison
             filename = r'c:\Users\ADMIN\Downloads\sales_data_cleaned_final.txt'
-            raw_lines = read_sales_data(filename)
-            transactions = parse_transactions(raw_lines)
-            sales_products = top_selling_products(transactions, n=1000)
+            sales_products = top_sales(filename, n=1000)
             
             compare_product_with_sales(single_product, sales_products)
         
@@ -1,43 +1,65 @@
-import csv
+import mmap
 
 input_file = r'c:\Users\ADMIN\Downloads\sales_data_pipe_delimited.txt'
 output_file = r'c:\Users\ADMIN\Downloads\sales_data_complete.txt'
 missing_file = r'c:\Users\ADMIN\Downloads\sales_data_missing_fields.txt'
 
-# Read and process the file
-complete_rows = []
+buffer_size = 1 << 20
+
+# Stream rows straight to the output files as they are classified
+complete_count = 0
 missing_rows = []
 
-with open(input_file, 'r', encoding='utf-8') as infile:
-    reader = csv.reader(infile, delimiter='|')
-    header = next(reader)
-    complete_rows.append(header)
+with open(input_file, 'rb') as infile, \
+        open(output_file, 'wb', buffering=buffer_size) as outfile, \
+        open(missing_file, 'wb', buffering=buffer_size) as missing_out, \
+        mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    # Scan the mapped bytes for newlines and pipes directly; lines are
+    # only decoded when a rejected row needs to be listed
+    write_complete = outfile.write
+    write_missing = missing_out.write
+    find = mm.find
+    size = len(mm)
+    
+    end = find(b'\n')
+    pos = size if end == -1 else end + 1
+    # Rows are written with CRLF endings, as csv.writer does
+    outfile.write(mm[:pos].rstrip(b'\r\n') + b'\r\n')
+    missing_out.write(b"RowNumber|TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n")
     
-    for row_num, row in enumerate(reader, 2):
-        # Check if row has all fields and CustomerID/Region are not empty
-        if len(row) >= 8:
-            customer_id = row[6].strip()
-            region = row[7].strip()
-            
-            if customer_id and region:  # Both fields have values
-                complete_rows.append(row)
-            else:
-                missing_rows.append((row_num, row))
+    row_num = 2
+    while pos < size:
+        end = find(b'\n', pos)
+        end = size if end == -1 else end + 1
+        body = mm[pos:end].rstrip(b'\r\n')
+        
+        # Offsets of the first 8 pipes; CustomerID and Region are the
+        # 7th and 8th fields
+        pipes = []
+        p = body.find(b'|')
+        while p != -1 and len(pipes) < 8:
+            pipes.append(p)
+            p = body.find(b'|', p + 1)
+        
+        complete = False
+        if len(pipes) >= 7:
+            region_end = pipes[7] if len(pipes) > 7 else len(body)
+            customer_id = body[pipes[5] + 1:pipes[6]]
+            region = body[pipes[6] + 1:region_end]
+            complete = bool(customer_id.strip() and region.strip())
+        
+        if complete:
+            write_complete(body + b'\r\n')
+            complete_count += 1
         else:
-            missing_rows.append((row_num, row))
-
-# Write complete rows
-with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-    writer = csv.writer(outfile, delimiter='|')
-    writer.writerows(complete_rows)
-
-# Write rows with missing fields
-with open(missing_file, 'w', encoding='utf-8', newline='') as outfile:
-    outfile.write("RowNumber|TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n")
-    for row_num, row in missing_rows:
-        outfile.write(f"{row_num}|" + '|'.join(row) + '\n')
+            write_missing(b'%d|' % row_num + body + b'\n')
+            # Only rejected rows are kept, for the listing below
+            missing_rows.append((row_num, body.decode('utf-8').split('|') if body else []))
+        
+        pos = end
+        row_num += 1
 
-print(f"Complete rows: {len(complete_rows) - 1}")
+print(f"Complete rows: {complete_count}")
 print(f"Missing CustomerID/Region: {len(missing_rows)}")
 print(f"\nComplete data saved to: {output_file}")
 print(f"Missing fields saved to: {missing_file}")
@@ -1,3 +1,7 @@
+import heapq
+from operator import itemgetter
+
+
 def find_peak_sales_day(transactions):
     """
     Identifies the date with highest revenue
@@ -8,29 +12,27 @@ def find_peak_sales_day(transactions):
     ('2024-12-15', 185000.0, 12)
     """
     
+    # date -> [revenue, transaction_count]; one dict lookup per row
     daily_stats = {}
+    get_stats = daily_stats.get
     
     # Aggregate data by date
     for transaction in transactions:
         date = transaction['Date']
-        revenue = transaction['Quantity'] * transaction['UnitPrice']
+        stats = get_stats(date)
+        if stats is None:
+            stats = daily_stats[date] = [0.0, 0]
         
-        if date not in daily_stats:
-            daily_stats[date] = {
-                'revenue': 0.0,
-                'transaction_count': 0
-            }
-        
-        daily_stats[date]['revenue'] += revenue
-        daily_stats[date]['transaction_count'] += 1
+        stats[0] += transaction['Quantity'] * transaction['UnitPrice']
+        stats[1] += 1
     
     # Find the date with highest revenue
     if not daily_stats:
         return None
     
-    peak_date = max(daily_stats.items(), key=lambda x: x[1]['revenue'])
+    peak_date, (peak_revenue, peak_count) = max(daily_stats.items(), key=lambda x: x[1][0])
     
-    return (peak_date[0], peak_date[1]['revenue'], peak_date[1]['transaction_count'])
+    return (peak_date, peak_revenue, peak_count)
 
 
 # Test the function
@@ -81,14 +83,16 @@ if __name__ == "__main__":
         print(f"TRANSACTIONS ON PEAK DAY ({peak_date})")
         print("="*80)
         
-        peak_day_transactions = [t for t in transactions if t['Date'] == peak_date]
-        peak_day_transactions.sort(key=lambda x: x['Quantity'] * x['UnitPrice'], reverse=True)
+        # Compute each revenue once and sort on it (decorate-sort-undecorate)
+        peak_day_transactions = [
+            (t['Quantity'] * t['UnitPrice'], t) for t in transactions if t['Date'] == peak_date
+        ]
+        peak_day_transactions.sort(key=itemgetter(0), reverse=True)
         
         print(f"\n{'TransID':<12} {'Product':<25} {'Quantity':<12} {'Unit Price':<15} {'Revenue':<20}")
         print("-"*80)
         
-        for trans in peak_day_transactions:
-            revenue = trans['Quantity'] * trans['UnitPrice']
+        for revenue, trans in peak_day_transactions:
             print(f"{trans['TransactionID']:<12} {trans['ProductName']:<25} {trans['Quantity']:<12} ${trans['UnitPrice']:>13,.2f} ${revenue:>17,.2f}")
         
         # Top 5 peak days
@@ -96,12 +100,16 @@ if __name__ == "__main__":
         print("TOP 5 PEAK SALES DAYS")
         print("="*80)
         
-        sorted_days = sorted(daily_trends.items(), key=lambda x: x[1]['revenue'], reverse=True)[:5]
+        sorted_days = heapq.nlargest(
+            5,
+            ((stats['revenue'], date, stats) for date, stats in daily_trends.items()),
+            key=itemgetter(0)
+        )
         
         print(f"\n{'Rank':<6} {'Date':<15} {'Revenue':<20} {'Transactions':<15} {'% of Total':<15}")
         print("-"*80)
         
-        for i, (date, stats) in enumerate(sorted_days, 1):
+        for i, (_, date, stats) in enumerate(sorted_days, 1):
             percentage = (stats['revenue'] / total_revenue) * 100
             print(f"{i:<6} {date:<15} ${stats['revenue']:>17,.2f} {stats['transaction_count']:<15} {percentage:>13.2f}%")
         
@@ -112,16 +120,19 @@ if __name__ == "__main__":
         
         from datetime import datetime
         
-        peak_datetime = datetime.strptime(peak_date, '%Y-%m-%d')
-        day_of_week = peak_datetime.strftime('%A')
+        # weekday() indexes straight into the day names
+        day_names = ('Monday', 'Tuesday', 'Wednesday', 'Thursday',
+                     'Friday', 'Saturday', 'Sunday')
+        strptime = datetime.strptime
+        
+        day_of_week = day_names[strptime(peak_date, '%Y-%m-%d').weekday()]
         
         print(f"\nPeak sales day falls on: {day_of_week}")
         
         # Analyze all dates by day of week
         day_of_week_stats = {}
         for date, stats in daily_trends.items():
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            dow = date_obj.strftime('%A')
+            dow = day_names[strptime(date, '%Y-%m-%d').weekday()]
             
             if dow not in day_of_week_stats:
                 day_of_week_stats[dow] = {
@@ -135,12 +146,16 @@ if __name__ == "__main__":
             day_of_week_stats[dow]['transactions'] += stats['transaction_count']
         
         # Sort by revenue
-        sorted_dow = sorted(day_of_week_stats.items(), key=lambda x: x[1]['revenue'], reverse=True)
+        sorted_dow = sorted(
+            ((stats['revenue'], dow, stats) for dow, stats in day_of_week_stats.items()),
+            key=itemgetter(0),
+            reverse=True
+        )
         
         print(f"\n{'Day of Week':<15} {'Total Revenue':<20} {'Avg Revenue/Day':<20} {'Avg Trans/Day':<15}")
         print("-"*80)
         
-        for dow, stats in sorted_dow:
+        for _, dow, stats in sorted_dow:
             avg_revenue = stats['revenue'] / stats['days'] if stats['days'] > 0 else 0
             avg_trans = stats['transactions'] / stats['days'] if stats['days'] > 0 else 0
             print(f"{dow:<15} ${stats['revenue']:>17,.2f} ${avg_revenue:>17,.2f} {avg_trans:>13.2f}")
@@ -3,8 +3,13 @@ Generate comprehensive sales analytics report
 """
 
 import os
+import sys
+import heapq
+import mmap
 from datetime import datetime
+from operator import itemgetter
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
 from read_sales_data import read_sales_data
 from parse_transactions import parse_transactions
 from validate_and_filter import validate_and_filter
@@ -17,10 +22,19 @@ from fetch_all_products import fetch_all_products
 from create_product_mapping import create_product_mapping
 
 
-def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt'):
+MMAP_WRITE_THRESHOLD = 64 * 1024
+
+# Below this size thread start-up costs more than it saves
+PARALLEL_MIN_TRANSACTIONS = 50_000
+
+
+def generate_sales_report(transactions, enriched_transactions, output_file='output/sales_report.txt', echo=False):
     """
     Generates a comprehensive formatted text report
 
+    The report is written to output_file; pass echo=True to also print it
+    to the console.
+
     Report Must Include (in this order):
 
     1. HEADER
@@ -102,16 +116,17 @@ def generate_sales_report(transactions, enriched_transactions, output_file='outp
         report_lines.extend(generate_enrichment_summary(enriched_transactions))
         
         # Write report to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
+        report_str = '\n'.join(report_lines)
+        write_report_file(report_str, output_file)
         
         file_size = os.path.getsize(output_file)
         print(f"[OK] Sales report generated: {output_file}")
         print(f"  File size: {file_size:,} bytes")
         print(f"  Records analyzed: {len(transactions)}\n")
         
-        # Also print to console
-        print('\n'.join(report_lines))
+        # Also print to console if requested
+        if echo:
+            print(report_str)
         
         return True
     
@@ -125,66 +140,167 @@ def generate_sales_report(transactions, enriched_transactions, output_file='outp
 def calculate_report_metrics(transactions, enriched_transactions):
     """
     Calculates all metrics needed for the report
+
+    On a free-threaded (no-GIL) Python build the transactions are split
+    into chunks aggregated on worker threads and then merged; otherwise
+    they are aggregated serially.
     """
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    workers = os.cpu_count() or 1
+    
+    if not gil_enabled and workers > 1 and len(transactions) >= PARALLEL_MIN_TRANSACTIONS:
+        chunk_size = -(-len(transactions) // workers)
+        chunks = [
+            transactions[i:i + chunk_size]
+            for i in range(0, len(transactions), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(aggregate_transactions, chunks))
+        
+        # Merge in chunk order so first-seen key order matches a serial run
+        totals = partials[0]
+        for partial in partials[1:]:
+            merge_metrics(totals, partial)
+    else:
+        totals = aggregate_transactions(transactions)
+    
+    # Assemble the nested per-key shape the report sections read, once
+    # per unique key rather than per transaction
+    region_count = totals['region_count']
+    product_quantity = totals['product_quantity']
+    product_name = totals['product_name']
+    customer_count = totals['customer_count']
+    daily_count = totals['daily_count']
+    daily_customers = totals['daily_customers']
+    
     metrics = {
-        'total_revenue': 0,
+        'total_revenue': totals['total_revenue'],
         'total_transactions': len(transactions),
         'transactions': transactions,
         'enriched_transactions': enriched_transactions,
-        'regions': defaultdict(lambda: {'revenue': 0, 'count': 0, 'transactions': []}),
-        'products': defaultdict(lambda: {'quantity': 0, 'revenue': 0, 'name': ''}),
-        'customers': defaultdict(lambda: {'spent': 0, 'count': 0}),
-        'daily_sales': defaultdict(lambda: {'revenue': 0, 'count': 0, 'customers': set()}),
-        'dates': [],
+        'regions': {
+            region: {'revenue': revenue, 'count': region_count[region]}
+            for region, revenue in totals['region_revenue'].items()
+        },
+        'products': {
+            product_id: {
+                'quantity': product_quantity[product_id],
+                'revenue': revenue,
+                'name': product_name[product_id]
+            }
+            for product_id, revenue in totals['product_revenue'].items()
+        },
+        'customers': {
+            customer_id: {'spent': spent, 'count': customer_count[customer_id]}
+            for customer_id, spent in totals['customer_spent'].items()
+        },
+        'daily_sales': {
+            date: {
+                'revenue': revenue,
+                'count': daily_count[date],
+                'unique_customers': len(daily_customers[date])
+            }
+            for date, revenue in totals['daily_revenue'].items()
+        },
+        # Daily revenue already holds one key per distinct date
+        'dates': sorted(totals['daily_revenue']),
     }
     
+    return metrics
+
+
+def aggregate_transactions(transactions):
+    """
+    Aggregates revenue, region, product, customer and daily totals
+    for a list (or chunk) of transactions
+
+    Returns: dictionary of flat per-key accumulators
+    """
+    region_revenue = defaultdict(float)
+    region_count = defaultdict(int)
+    product_quantity = defaultdict(float)
+    product_revenue = defaultdict(float)
+    customer_spent = defaultdict(float)
+    customer_count = defaultdict(int)
+    daily_revenue = defaultdict(float)
+    daily_count = defaultdict(int)
+    daily_customers = defaultdict(set)
+    total_revenue = 0
+    
+    # Transactions come from validate_sales_transactions, so every field
+    # is present and numeric fields are already converted
     for tx in transactions:
-        try:
-            qty = float(tx.get('Quantity', 0))
-            price = float(tx.get('UnitPrice', 0))
-            revenue = qty * price
-            
-            # Overall metrics
-            metrics['total_revenue'] += revenue
-            
-            # Region metrics
-            region = tx.get('Region', 'Unknown')
-            if region is None or region == '':
-                region = 'Unknown'
-            metrics['regions'][region]['revenue'] += revenue
-            metrics['regions'][region]['count'] += 1
-            metrics['regions'][region]['transactions'].append(revenue)
-            
-            # Product metrics
-            product_id = tx.get('ProductID', 'Unknown')
-            product_name = tx.get('ProductName', 'Unknown')
-            metrics['products'][product_id]['quantity'] += qty
-            metrics['products'][product_id]['revenue'] += revenue
-            metrics['products'][product_id]['name'] = product_name
-            
-            # Customer metrics
-            customer_id = tx.get('CustomerID', 'Unknown')
-            if customer_id is None or customer_id == '':
-                customer_id = 'Unknown'
-            metrics['customers'][customer_id]['spent'] += revenue
-            metrics['customers'][customer_id]['count'] += 1
-            
-            # Daily metrics
-            date = tx.get('Date', 'Unknown')
-            if date is None or date == '':
-                date = 'Unknown'
-            metrics['daily_sales'][date]['revenue'] += revenue
-            metrics['daily_sales'][date]['count'] += 1
-            metrics['daily_sales'][date]['customers'].add(customer_id)
-            metrics['dates'].append(date)
-        
-        except Exception as e:
-            print(f"⚠ Warning: Error processing transaction: {e}")
-            continue
+        qty = tx['Quantity']
+        revenue = qty * tx['UnitPrice']
+        
+        # Overall metrics
+        total_revenue += revenue
+        
+        # Region metrics
+        region = tx['Region']
+        region_revenue[region] += revenue
+        region_count[region] += 1
+        
+        # Product metrics
+        product_id = tx['ProductID']
+        product_quantity[product_id] += qty
+        product_revenue[product_id] += revenue
+        
+        # Customer metrics
+        customer_id = tx['CustomerID']
+        customer_spent[customer_id] += revenue
+        customer_count[customer_id] += 1
+        
+        # Daily metrics
+        date = tx['Date']
+        daily_revenue[date] += revenue
+        daily_count[date] += 1
+        daily_customers[date].add(customer_id)
+    
+    # Fill each product's name once: walking back from the end finds the
+    # last name seen for every product, usually after only a few rows
+    product_name = {}
+    remaining = len(product_revenue)
+    for tx in reversed(transactions):
+        if not remaining:
+            break
+        product_id = tx['ProductID']
+        if product_id not in product_name:
+            product_name[product_id] = tx['ProductName']
+            remaining -= 1
+    
+    return {
+        'total_revenue': total_revenue,
+        'region_revenue': region_revenue,
+        'region_count': region_count,
+        'product_quantity': product_quantity,
+        'product_revenue': product_revenue,
+        'product_name': product_name,
+        'customer_spent': customer_spent,
+        'customer_count': customer_count,
+        'daily_revenue': daily_revenue,
+        'daily_count': daily_count,
+        'daily_customers': daily_customers,
+    }
+
+
+def merge_metrics(totals, partial):
+    """
+    Merges totals aggregated from a later chunk into totals
+    """
+    totals['total_revenue'] += partial['total_revenue']
     
-    metrics['dates'] = sorted(set(metrics['dates']))
+    for key in ('region_revenue', 'region_count', 'product_quantity', 'product_revenue',
+                'customer_spent', 'customer_count', 'daily_revenue', 'daily_count'):
+        merged = totals[key]
+        for name, value in partial[key].items():
+            merged[name] += value
     
-    return metrics
+    totals['product_name'].update(partial['product_name'])
+    
+    daily_customers = totals['daily_customers']
+    for date, customer_ids in partial['daily_customers'].items():
+        daily_customers[date] |= customer_ids
 
 
 def generate_header(total_records):
@@ -214,7 +330,7 @@ def generate_overall_summary(metrics):
     total_revenue = metrics['total_revenue']
     total_transactions = metrics['total_transactions']
     avg_order_value = total_revenue / total_transactions if total_transactions > 0 else 0
-    dates = sorted(metrics['dates'])
+    dates = metrics['dates']
     date_range = f"{dates[0]} to {dates[-1]}" if dates else "N/A"
     
     lines.append("OVERALL SUMMARY")
@@ -242,17 +358,22 @@ def generate_region_performance(metrics):
     
     # Sort regions by revenue descending
     sorted_regions = sorted(
-        metrics['regions'].items(),
-        key=lambda x: x[1]['revenue'],
+        ((data['revenue'], region, data) for region, data in metrics['regions'].items()),
+        key=itemgetter(0),
         reverse=True
     )
     
-    for region, data in sorted_regions:
-        revenue = data['revenue']
-        count = data['count']
-        percentage = (revenue / total_revenue * 100) if total_revenue > 0 else 0
-        
-        lines.append(f"{region:<15} ${revenue:>18,.2f} {percentage:>13.2f}% {count:>14,}")
+    # Format every row from one bound template and add them in one extend
+    row_fmt = "{:<15} ${:>18,.2f} {:>13.2f}% {:>14,}".format
+    lines.extend(
+        row_fmt(
+            region,
+            revenue,
+            (revenue / total_revenue * 100) if total_revenue > 0 else 0,
+            data['count']
+        )
+        for revenue, region, data in sorted_regions
+    )
     
     lines.append("")
     
@@ -270,19 +391,18 @@ def generate_top_products(metrics):
     lines.append(f"{'Rank':<8} {'Product Name':<35} {'Qty Sold':<15} {'Revenue':<20}")
     lines.append("-" * 80)
     
-    # Sort products by revenue descending
-    sorted_products = sorted(
-        metrics['products'].items(),
-        key=lambda x: x[1]['revenue'],
-        reverse=True
-    )[:5]
+    # Top 5 products by revenue
+    sorted_products = heapq.nlargest(
+        5,
+        ((data['revenue'], product_id, data) for product_id, data in metrics['products'].items()),
+        key=itemgetter(0)
+    )
     
-    for rank, (product_id, data) in enumerate(sorted_products, 1):
-        name = data['name'][:32]
-        qty = data['quantity']
-        revenue = data['revenue']
-        
-        lines.append(f"{rank:<8} {name:<35} {qty:>14,.0f} ${revenue:>18,.2f}")
+    row_fmt = "{:<8} {:<35} {:>14,.0f} ${:>18,.2f}".format
+    lines.extend(
+        row_fmt(rank, data['name'][:32], data['quantity'], revenue)
+        for rank, (revenue, product_id, data) in enumerate(sorted_products, 1)
+    )
     
     lines.append("")
     
@@ -300,18 +420,18 @@ def generate_top_customers(metrics):
     lines.append(f"{'Rank':<8} {'Customer ID':<20} {'Total Spent':<20} {'Order Count':<15}")
     lines.append("-" * 80)
     
-    # Sort customers by spending descending
-    sorted_customers = sorted(
-        metrics['customers'].items(),
-        key=lambda x: x[1]['spent'],
-        reverse=True
-    )[:5]
+    # Top 5 customers by spending
+    sorted_customers = heapq.nlargest(
+        5,
+        ((data['spent'], customer_id, data) for customer_id, data in metrics['customers'].items()),
+        key=itemgetter(0)
+    )
     
-    for rank, (customer_id, data) in enumerate(sorted_customers, 1):
-        spent = data['spent']
-        count = data['count']
-        
-        lines.append(f"{rank:<8} {customer_id:<20} ${spent:>18,.2f} {count:>14,}")
+    row_fmt = "{:<8} {:<20} ${:>18,.2f} {:>14,}".format
+    lines.extend(
+        row_fmt(rank, customer_id, spent, data['count'])
+        for rank, (spent, customer_id, data) in enumerate(sorted_customers, 1)
+    )
     
     lines.append("")
     
@@ -329,13 +449,11 @@ def generate_daily_trend(metrics):
     lines.append(f"{'Date':<15} {'Revenue':<20} {'Transactions':<15} {'Unique Customers':<20}")
     lines.append("-" * 80)
     
-    for date in sorted(metrics['daily_sales'].keys()):
-        data = metrics['daily_sales'][date]
-        revenue = data['revenue']
-        count = data['count']
-        customers = len(data['customers'])
-        
-        lines.append(f"{date:<15} ${revenue:>18,.2f} {count:>14,} {customers:>19,}")
+    row_fmt = "{:<15} ${:>18,.2f} {:>14,} {:>19,}".format
+    lines.extend(
+        row_fmt(date, data['revenue'], data['count'], data['unique_customers'])
+        for date, data in sorted(metrics['daily_sales'].items())
+    )
     
     lines.append("")
     
@@ -353,11 +471,11 @@ def generate_performance_analysis(metrics):
     
     # Best selling day
     if metrics['daily_sales']:
-        best_day = max(
-            metrics['daily_sales'].items(),
-            key=lambda x: x[1]['revenue']
+        best_revenue, best_date = max(
+            ((data['revenue'], date) for date, data in metrics['daily_sales'].items()),
+            key=itemgetter(0)
         )
-        lines.append(f"Best Selling Day:       {best_day[0]} (${best_day[1]['revenue']:,.2f})")
+        lines.append(f"Best Selling Day:       {best_date} (${best_revenue:,.2f})")
     
     # Average transaction value per region
     lines.append("")
@@ -366,14 +484,14 @@ def generate_performance_analysis(metrics):
     
     for region, data in sorted(metrics['regions'].items()):
         if data['count'] > 0:
-            avg_value = sum(data['transactions']) / data['count']
+            avg_value = data['revenue'] / data['count']
             lines.append(f"  {region:<15} ${avg_value:,.2f}")
     
     # Low performing products (less than average)
     if metrics['products']:
         avg_qty = sum(p['quantity'] for p in metrics['products'].values()) / len(metrics['products'])
         low_performers = [
-            (pid, data) for pid, data in metrics['products'].items()
+            (data['quantity'], pid, data) for pid, data in metrics['products'].items()
             if data['quantity'] < avg_qty * 0.5
         ]
         
@@ -382,7 +500,7 @@ def generate_performance_analysis(metrics):
             lines.append("Low Performing Products (< 50% of avg):")
             lines.append("-" * 80)
             
-            for product_id, data in sorted(low_performers, key=lambda x: x[1]['quantity']):
+            for _, product_id, data in sorted(low_performers, key=itemgetter(0)):
                 lines.append(f"  {product_id}: {data['name']} - {data['quantity']:.0f} units (${data['revenue']:,.2f})")
     
     lines.append("")
@@ -408,23 +526,18 @@ def generate_enrichment_summary(enriched_transactions):
     lines.append(f"Not Matched:              {unmatched} ({100 - success_rate:.1f}%)")
     
     if unmatched > 0:
-        # List unmatched products
-        unmatched_products = set()
-        for t in enriched_transactions:
-            if not t.get('API_Match', False):
-                product_name = t.get('ProductName', 'Unknown')
-                unmatched_products.add(product_name)
+        # Count unmatched transactions per product in one pass
+        unmatched_products = Counter(
+            t.get('ProductName', 'Unknown') for t in enriched_transactions
+            if not t.get('API_Match', False)
+        )
         
         if unmatched_products:
             lines.append("")
             lines.append("Products Not Matched with API:")
             lines.append("-" * 80)
             
-            for product_name in sorted(unmatched_products):
-                count = sum(
-                    1 for t in enriched_transactions
-                    if not t.get('API_Match', False) and t.get('ProductName') == product_name
-                )
+            for product_name, count in sorted(unmatched_products.items()):
                 lines.append(f"  • {product_name} ({count} transactions)")
     
     lines.append("")
@@ -433,6 +546,27 @@ def generate_enrichment_summary(enriched_transactions):
     return lines
 
 
+def write_report_file(report_content, output_file):
+    """
+    Writes report text to file, copying large reports through a memory map
+
+    Line endings are translated to the platform's, as text-mode writes do.
+    """
+    report_bytes = report_content.replace('\n', os.linesep).encode('utf-8')
+    
+    # Small reports aren't worth the mapping setup
+    if len(report_bytes) < MMAP_WRITE_THRESHOLD:
+        with open(output_file, 'wb') as f:
+            f.write(report_bytes)
+        return
+    
+    with open(output_file, 'w+b') as f:
+        f.truncate(len(report_bytes))
+        with mmap.mmap(f.fileno(), len(report_bytes)) as mm:
+            mm[:] = report_bytes
+            mm.flush()
+
+
 def save_report_to_file(report_content, output_file):
     """
     Saves report to file
@@ -442,8 +576,7 @@ def save_report_to_file(report_content, output_file):
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        write_report_file(report_content, output_file)
         
         print(f"✓ Report saved to: {output_file}")
         return True
@@ -516,7 +649,7 @@ if __name__ == "__main__":
         print("-" * 120 + "\n")
         
         output_file = r'c:\Users\ADMIN\Downloads\sales_report.txt'
-        generate_sales_report(valid_transactions, enriched_transactions, output_file)
+        generate_sales_report(valid_transactions, enriched_transactions, output_file, echo=True)
         
         print(f"\n{'='*120}")
         print("REPORT GENERATION COMPLETE")
@@ -1,3 +1,7 @@
+from operator import itemgetter
+from sales_aggregation import sum_by_group
+
+
 def low_performing_products(transactions, threshold=10):
     """
     Identifies products with low sales
@@ -17,32 +21,17 @@ def low_performing_products(transactions, threshold=10):
     - Sort by TotalQuantity ascending
     """
     
-    product_stats = {}
-    
-    # Aggregate product data
-    for transaction in transactions:
-        product_name = transaction['ProductName']
-        quantity = transaction['Quantity']
-        revenue = quantity * transaction['UnitPrice']
-        
-        if product_name not in product_stats:
-            product_stats[product_name] = {
-                'total_quantity': 0,
-                'total_revenue': 0.0
-            }
-        
-        product_stats[product_name]['total_quantity'] += quantity
-        product_stats[product_name]['total_revenue'] += revenue
+    product_stats = sum_by_group(transactions, 'ProductName')
     
     # Filter products below threshold
     low_products = [
-        (product_name, stats['total_quantity'], stats['total_revenue'])
-        for product_name, stats in product_stats.items()
-        if stats['total_quantity'] < threshold
+        (product_name, total_quantity, total_revenue)
+        for product_name, (total_quantity, total_revenue, _) in product_stats.items()
+        if total_quantity < threshold
     ]
     
     # Sort by total quantity ascending
-    low_products.sort(key=lambda x: x[1])
+    low_products.sort(key=itemgetter(1))
     
     return low_products
 
@@ -51,7 +40,6 @@ def low_performing_products(transactions, threshold=10):
 if __name__ == "__main__":
     from read_sales_data import read_sales_data
     from parse_transactions import parse_transactions
-    from top_selling_products import top_selling_products
     from calculate_total_revenue import calculate_total_revenue
     
     try:
@@ -77,12 +65,16 @@ if __name__ == "__main__":
                 print(f"\n{'Rank':<6} {'Product Name':<30} {'Quantity':<15} {'Revenue':<20}")
                 print("-"*90)
                 
+                # Accumulate totals while printing the table
+                total_quantity = 0
+                total_revenue = 0.0
+                
                 for i, (product_name, quantity, revenue) in enumerate(low_products, 1):
                     print(f"{i:<6} {product_name:<30} {quantity:<15} ${revenue:>17,.2f}")
+                    total_quantity += quantity
+                    total_revenue += revenue
                 
                 print(f"\nTotal Low-Performing Products: {len(low_products)}")
-                total_quantity = sum(qty for _, qty, _ in low_products)
-                total_revenue = sum(rev for _, _, rev in low_products)
                 print(f"Combined Quantity: {total_quantity} units")
                 print(f"Combined Revenue: ${total_revenue:,.2f}")
             else:
@@ -98,7 +90,6 @@ if __name__ == "__main__":
         low_products_10 = low_performing_products(transactions, threshold=10)
         
         if low_products_10:
-            all_products = top_selling_products(transactions, n=1000)
             total_revenue = calculate_total_revenue(transactions)
             
             print(f"\n{'Rank':<6} {'Product':<30} {'Qty':<10} {'Revenue':<20} {'% of Total':<15} {'Avg Price':<15}")
@@ -114,14 +105,24 @@ if __name__ == "__main__":
             print("RISK ASSESSMENT FOR LOW PERFORMERS")
             print("="*90)
             
-            for product_name, quantity, revenue in low_products_10:
+            # Bucket products by risk level in the same pass
+            critical_products = []
+            high_risk_products = []
+            medium_risk_products = []
+            
+            for product in low_products_10:
+                product_name, quantity, revenue = product
+                
                 # Determine risk level
                 if quantity <= 3:
                     risk = "🔴 CRITICAL - Consider discontinuing"
+                    critical_products.append(product)
                 elif quantity <= 6:
                     risk = "🟠 HIGH - Needs improvement plan"
+                    high_risk_products.append(product)
                 else:
                     risk = "🟡 MEDIUM - Monitor closely"
+                    medium_risk_products.append(product)
                 
                 print(f"\n{product_name}")
                 print(f"  Quantity: {quantity} units")
@@ -133,10 +134,6 @@ if __name__ == "__main__":
             print("RECOMMENDATIONS")
             print("="*90)
             
-            critical_products = [p for p in low_products_10 if p[1] <= 3]
-            high_risk_products = [p for p in low_products_10 if 3 < p[1] <= 6]
-            medium_risk_products = [p for p in low_products_10 if 6 < p[1] < 10]
-            
             print(f"""
 CRITICAL PRODUCTS ({len(critical_products)}): 
   - Consider discontinuing or heavy promotion
@@ -155,25 +155,30 @@ def main():
         # Step 3: Display filter options
         print_step(3, total_steps, "Analyzing available filters")
         
-        # Calculate statistics for filter display
+        # Calculate statistics for filter display in a single scan,
+        # keeping a running amount range instead of a list of amounts
         regions = set()
-        amounts = []
+        min_amount = None
+        max_amount = None
         
         for tx in raw_transactions:
             region = tx.get('Region')
             if region:
                 regions.add(region)
             
-            try:
-                qty = float(tx.get('Quantity', 0))
-                price = float(tx.get('UnitPrice', 0))
-                if qty > 0 and price > 0:
-                    amounts.append(qty * price)
-            except:
-                pass
-        
-        min_amount = min(amounts) if amounts else 0
-        max_amount = max(amounts) if amounts else 0
+            # parse_sales_data_raw already converted these to int/float
+            # (0 when unparseable), so no per-row conversion is needed
+            qty = tx.get('Quantity', 0)
+            price = tx.get('UnitPrice', 0)
+            if qty > 0 and price > 0:
+                amount = qty * price
+                if min_amount is None or amount < min_amount:
+                    min_amount = amount
+                if max_amount is None or amount > max_amount:
+                    max_amount = amount
+        
+        if min_amount is None:
+            min_amount = max_amount = 0
         
         print_success(f"Found {len(regions)} regions and amount range ${min_amount:,.2f} - ${max_amount:,.2f}")
         
@@ -1,3 +1,8 @@
+import sys
+
+from read_sales_data import read_sales_data, read_with_fallback
+
+
 def parse_transactions(raw_lines):
     """
     Parses raw lines into clean list of dictionaries
@@ -33,10 +38,23 @@ def parse_transactions(raw_lines):
     field_names = ['TransactionID', 'Date', 'ProductID', 'ProductName', 
                    'Quantity', 'UnitPrice', 'CustomerID', 'Region']
     
+    # ProductName and Region repeat across rows; interning shares one
+    # string object per value and makes grouping on them cheaper
+    intern = sys.intern
+    
+    # Bind builtins and str methods as locals (LOAD_FAST) so the loop
+    # body avoids global and attribute lookups per field
+    split = str.split
+    strip = str.strip
+    replace = str.replace
+    to_int = int
+    to_float = float
+    append = transactions.append
+    
     for line in raw_lines:
         try:
             # Split by pipe delimiter
-            fields = line.split('|')
+            fields = split(line, '|')
             
             # Skip rows with incorrect number of fields
             if len(fields) != 8:
@@ -45,24 +63,24 @@ def parse_transactions(raw_lines):
             # Create dictionary with stripped values
             transaction = {}
             
-            transaction['TransactionID'] = fields[0].strip()
-            transaction['Date'] = fields[1].strip()
-            transaction['ProductID'] = fields[2].strip()
+            transaction['TransactionID'] = strip(fields[0])
+            transaction['Date'] = strip(fields[1])
+            transaction['ProductID'] = strip(fields[2])
             # Handle commas in ProductName - just strip them
-            transaction['ProductName'] = fields[3].strip().replace(',', '')
+            transaction['ProductName'] = intern(replace(strip(fields[3]), ',', ''))
             
             # Convert Quantity to int (remove commas first)
-            quantity_str = fields[4].strip().replace(',', '')
-            transaction['Quantity'] = int(quantity_str)
+            quantity_str = replace(strip(fields[4]), ',', '')
+            transaction['Quantity'] = to_int(quantity_str)
             
             # Convert UnitPrice to float (remove commas first)
-            price_str = fields[5].strip().replace(',', '')
-            transaction['UnitPrice'] = float(price_str)
+            price_str = replace(strip(fields[5]), ',', '')
+            transaction['UnitPrice'] = to_float(price_str)
             
-            transaction['CustomerID'] = fields[6].strip()
-            transaction['Region'] = fields[7].strip()
+            transaction['CustomerID'] = strip(fields[6])
+            transaction['Region'] = intern(strip(fields[7]))
             
-            transactions.append(transaction)
+            append(transaction)
         
         except (ValueError, IndexError):
             # Skip rows with conversion errors
@@ -71,11 +89,18 @@ def parse_transactions(raw_lines):
     return transactions
 
 
+def load_transactions(filename):
+    """
+    Reads and parses a sales data file in one call, streaming its lines
+
+    Returns: list of transaction dictionaries (see parse_transactions)
+    """
+    # Safe to re-run on a decode error because each parse builds a fresh list
+    return read_with_fallback(filename, parse_transactions)
+
+
 # Test the function
 if __name__ == "__main__":
-    # First, import and use the read_sales_data function
-    from read_sales_data import read_sales_data
-    
     try:
         filename = r'c:\Users\ADMIN\Downloads\sales_data_cleaned_final.txt'
         
@@ -1,3 +1,101 @@
+import codecs
+
+
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# Retried in the same order as probe_encoding; latin-1 decodes any byte
+FALLBACK_ENCODINGS = ('cp1252', 'latin-1')
+
+
+def probe_encoding(filename):
+    """
+    Detects the file encoding from its first 4 KiB, read once
+
+    Checks for a byte order mark, then whether the head is valid UTF-8,
+    falling back to cp1252 (or latin-1, which decodes any byte).
+
+    Returns: encoding name (string)
+    """
+    try:
+        with open(filename, 'rb') as file:
+            head = file.read(4096)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: File '{filename}' not found.")
+    
+    for bom, encoding in BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    
+    try:
+        # Incremental decode so a character cut at the 4 KiB edge is fine
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    try:
+        head.decode('cp1252')
+        return 'cp1252'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def iter_sales_data(filename, encoding=None):
+    """
+    Streams sales data lines from file without loading it all into memory
+
+    Yields: stripped, non-empty data lines (header row skipped)
+
+    The encoding is detected from the start of the file unless given.
+    """
+    if encoding is None:
+        encoding = probe_encoding(filename)
+    
+    try:
+        with open(filename, 'r', encoding=encoding) as file:
+            # Skip header row
+            next(file, None)
+            
+            for line in file:
+                # Strip whitespace and skip empty lines
+                stripped_line = line.strip()
+                if stripped_line:
+                    yield stripped_line
+    
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: File '{filename}' not found.")
+
+
+def read_with_fallback(filename, consume):
+    """
+    Calls consume() on the streamed lines of a sales data file
+
+    If an undecodable byte turns up past the probed head, the read is
+    restarted with the next of FALLBACK_ENCODINGS, the same order the
+    probe uses, so a byte decodes the same way wherever it sits in the file.
+
+    Returns: whatever consume returns
+    """
+    encoding = probe_encoding(filename)
+    
+    if encoding in FALLBACK_ENCODINGS:
+        fallbacks = FALLBACK_ENCODINGS[FALLBACK_ENCODINGS.index(encoding) + 1:]
+    else:
+        fallbacks = FALLBACK_ENCODINGS
+    
+    for fallback in fallbacks:
+        try:
+            return consume(iter_sales_data(filename, encoding))
+        except UnicodeDecodeError:
+            encoding = fallback
+    
+    return consume(iter_sales_data(filename, encoding))
+
+
 def read_sales_data(filename):
     """
     Reads sales data from file handling encoding issues
@@ -9,42 +107,18 @@ def read_sales_data(filename):
 
     Requirements:
     - Use 'with' statement
-    - Handle different encodings (try 'utf-8', 'latin-1', 'cp1252')
+    - Handle different encodings (detected once: BOM, 'utf-8', 'cp1252', 'latin-1')
     - Handle FileNotFoundError with appropriate error message
     - Skip the header row
     - Remove empty lines
     """
-    encodings = ['utf-8', 'latin-1', 'cp1252']
-    data_lines = []
-    
-    for encoding in encodings:
-        try:
-            with open(filename, 'r', encoding=encoding) as file:
-                lines = file.readlines()
-                
-                # Skip header row and remove empty lines
-                for i, line in enumerate(lines):
-                    # Skip first line (header)
-                    if i == 0:
-                        continue
-                    
-                    # Strip whitespace and skip empty lines
-                    stripped_line = line.strip()
-                    if stripped_line:
-                        data_lines.append(stripped_line)
-                
-                return data_lines
-        
-        except UnicodeDecodeError:
-            # Try next encoding
-            continue
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Error: File '{filename}' not found.")
-        except Exception as e:
-            raise Exception(f"Error reading file: {str(e)}")
+    try:
+        return read_with_fallback(filename, list)
     
-    # If all encodings fail
-    raise UnicodeDecodeError('utf-8', b'', 0, 1, f"Could not decode file '{filename}' with any supported encoding (utf-8, latin-1, cp1252)")
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        raise Exception(f"Error reading file: {str(e)}")
 
 
 # Test the function
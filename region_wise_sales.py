@@ -1,3 +1,7 @@
+from operator import itemgetter
+from sales_aggregation import sum_by_group
+
+
 def region_wise_sales(transactions):
     """
     Analyzes sales by region
@@ -22,35 +26,25 @@ def region_wise_sales(transactions):
     - Sort by total_sales in descending order
     """
     
-    region_stats = {}
-    total_revenue = 0.0
-    
-    # First pass: calculate total revenue and gather region data
-    for transaction in transactions:
-        region = transaction['Region']
-        sales_amount = transaction['Quantity'] * transaction['UnitPrice']
-        total_revenue += sales_amount
-        
-        if region not in region_stats:
-            region_stats[region] = {
-                'total_sales': 0.0,
-                'transaction_count': 0
-            }
-        
-        region_stats[region]['total_sales'] += sales_amount
-        region_stats[region]['transaction_count'] += 1
-    
-    # Second pass: calculate percentages and sort
-    for region in region_stats:
-        percentage = (region_stats[region]['total_sales'] / total_revenue) * 100
-        region_stats[region]['percentage'] = round(percentage, 2)
+    region_totals = sum_by_group(transactions, 'Region')
+    total_revenue = sum(total_sales for _, total_sales, _ in region_totals.values())
     
     # Sort by total_sales in descending order
-    sorted_regions = dict(sorted(region_stats.items(), 
-                                 key=lambda x: x[1]['total_sales'], 
-                                 reverse=True))
+    ranked_regions = sorted(
+        ((total_sales, region, count) for region, (_, total_sales, count) in region_totals.items()),
+        key=itemgetter(0),
+        reverse=True
+    )
     
-    return sorted_regions
+    # Build the result with percentages in the same pass
+    return {
+        region: {
+            'total_sales': total_sales,
+            'transaction_count': count,
+            'percentage': round((total_sales / total_revenue) * 100, 2)
+        }
+        for total_sales, region, count in ranked_regions
+    }
 
 
 # Test the function
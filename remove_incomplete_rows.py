@@ -3,10 +3,12 @@ import csv
 input_file = r'c:\Users\ADMIN\Downloads\sales_data_pipe_delimited.txt'
 output_file = r'c:\Users\ADMIN\Downloads\sales_data_clean.txt'
 
+buffer_size = 1 << 20
+
 # Read and filter out incomplete rows
 rows_to_keep = []
 
-with open(input_file, 'r', encoding='utf-8') as infile:
+with open(input_file, 'r', encoding='utf-8', buffering=buffer_size) as infile:
     reader = csv.reader(infile, delimiter='|')
     
     for row_num, row in enumerate(reader):
@@ -28,7 +30,7 @@ with open(input_file, 'r', encoding='utf-8') as infile:
                 rows_to_keep.append(row)
 
 # Write clean data
-with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
+with open(output_file, 'w', encoding='utf-8', newline='', buffering=buffer_size) as outfile:
     writer = csv.writer(outfile, delimiter='|')
     writer.writerows(rows_to_keep)
 
@@ -4,10 +4,14 @@ input_file = r'c:\Users\ADMIN\Downloads\sales_data_validated.txt'
 output_file = r'c:\Users\ADMIN\Downloads\sales_data_cleaned_final.txt'
 removed_file = r'c:\Users\ADMIN\Downloads\sales_data_invalid_transactionid.txt'
 
+buffer_size = 1 << 20
+
+max_display = 20
+
 rows_to_keep = []
 rows_removed = []
 
-with open(input_file, 'r', encoding='utf-8') as infile:
+with open(input_file, 'r', encoding='utf-8', buffering=buffer_size) as infile:
     reader = csv.reader(infile, delimiter='|')
     header = next(reader)
     rows_to_keep.append(header)
@@ -21,15 +25,14 @@ with open(input_file, 'r', encoding='utf-8') as infile:
                 rows_removed.append((row_num, row))
 
 # Write valid data
-with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
+with open(output_file, 'w', encoding='utf-8', newline='', buffering=buffer_size) as outfile:
     writer = csv.writer(outfile, delimiter='|')
     writer.writerows(rows_to_keep)
 
 # Write removed rows
-with open(removed_file, 'w', encoding='utf-8', newline='') as outfile:
+with open(removed_file, 'w', encoding='utf-8', newline='', buffering=buffer_size) as outfile:
     outfile.write("RowNumber|TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n")
-    for row_num, row in rows_removed:
-        outfile.write(f"{row_num}|" + '|'.join(row) + '\n')
+    outfile.write(''.join(f"{row_num}|{'|'.join(row)}\n" for row_num, row in rows_removed))
 
 print(f"Valid rows kept: {len(rows_to_keep) - 1}")
 print(f"Rows removed (TransactionID not starting with 'T'): {len(rows_removed)}")
@@ -38,5 +41,7 @@ print(f"Removed data saved to: {removed_file}")
 
 if rows_removed:
     print("\nRemoved transactions:")
-    for row_num, row in rows_removed:
+    for row_num, row in rows_removed[:max_display]:
         print(f"  Row {row_num}: {row[0]}")
+    if len(rows_removed) > max_display:
+        print(f"  ... and {len(rows_removed) - max_display} more (see {removed_file})")
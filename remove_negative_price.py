@@ -4,43 +4,46 @@ input_file = r'c:\Users\ADMIN\Downloads\sales_data_final.txt'
 output_file = r'c:\Users\ADMIN\Downloads\sales_data_validated.txt'
 removed_file = r'c:\Users\ADMIN\Downloads\sales_data_negative_price.txt'
 
-rows_to_keep = []
+buffer_size = 1 << 20
+
+max_display = 20
+
+rows_kept = 0
 rows_removed = []
 
-with open(input_file, 'r', encoding='utf-8') as infile:
+# Stream valid rows straight to the output instead of collecting them
+with open(input_file, 'r', encoding='utf-8', buffering=buffer_size) as infile, \
+     open(output_file, 'w', encoding='utf-8', newline='', buffering=buffer_size) as outfile:
     reader = csv.reader(infile, delimiter='|')
-    header = next(reader)
-    rows_to_keep.append(header)
+    writer = csv.writer(outfile, delimiter='|')
+    writer.writerow(next(reader))
     
     for row_num, row in enumerate(reader, 2):
         if len(row) >= 6:
-            price_str = row[5].strip().replace(',', '')
+            price_str = row[5].replace(',', '')
             try:
                 price = float(price_str)
                 if price > 0:
-                    rows_to_keep.append(row)
+                    writer.writerow(row)
+                    rows_kept += 1
                 else:
                     rows_removed.append((row_num, row))
             except ValueError:
                 rows_removed.append((row_num, row))
 
-# Write valid data
-with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-    writer = csv.writer(outfile, delimiter='|')
-    writer.writerows(rows_to_keep)
-
 # Write removed rows
-with open(removed_file, 'w', encoding='utf-8', newline='') as outfile:
+with open(removed_file, 'w', encoding='utf-8', newline='', buffering=buffer_size) as outfile:
     outfile.write("RowNumber|TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n")
-    for row_num, row in rows_removed:
-        outfile.write(f"{row_num}|" + '|'.join(row) + '\n')
+    outfile.write(''.join(f"{row_num}|{'|'.join(row)}\n" for row_num, row in rows_removed))
 
-print(f"Valid rows kept: {len(rows_to_keep) - 1}")
+print(f"Valid rows kept: {rows_kept}")
 print(f"Rows removed (UnitPrice ≤ 0): {len(rows_removed)}")
 print(f"\nValidated data saved to: {output_file}")
 print(f"Removed data saved to: {removed_file}")
 
 if rows_removed:
     print("\nRemoved transactions:")
-    for row_num, row in rows_removed:
+    for row_num, row in rows_removed[:max_display]:
         print(f"  Row {row_num}: {row[0]} - UnitPrice: {row[5]}")
+    if len(rows_removed) > max_display:
+        print(f"  ... and {len(rows_removed) - max_display} more (see {removed_file})")
@@ -0,0 +1,38 @@
+"""
+Shared aggregation kernel for per-group quantity and revenue totals
+"""
+
+from operator import itemgetter
+
+
+def sum_by_group(transactions, key_field):
+    """
+    Sums quantity and revenue of transactions grouped by one field
+
+    Args:
+        transactions (list): Parsed transaction dictionaries
+        key_field (str): Field to group by, e.g. 'ProductName' or 'Region'
+
+    Returns: dictionary mapping each group to [total_quantity, total_revenue, count]
+             in first-seen order
+
+    Expected Output Format:
+    {'North': [45, 450000.0, 15], 'South': [...], ...}
+    """
+    groups = {}
+    get_group = groups.get
+    # Fetch all three fields with one C-level call per row
+    get_fields = itemgetter(key_field, 'Quantity', 'UnitPrice')
+    
+    for transaction in transactions:
+        key, quantity, unit_price = get_fields(transaction)
+        
+        totals = get_group(key)
+        if totals is None:
+            totals = groups[key] = [0, 0.0, 0]
+        
+        totals[0] += quantity
+        totals[1] += quantity * unit_price
+        totals[2] += 1
+    
+    return groups
@@ -0,0 +1,87 @@
+"""
+Shared read -> parse -> top-products pipeline for the sales data file
+
+Several scripts need the full product list from the same sales file.
+Results are cached in memory and on disk (keyed by the file's absolute
+path, size and mtime) so running the analysis suite only reads and
+parses the file once.
+"""
+
+import glob
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+
+from parse_transactions import load_transactions
+from top_selling_products import top_selling_products
+
+
+# Next to this module, so scripts started from any directory share it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# Bump whenever top_selling_products' output changes so pickles written
+# by older code are never served
+CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=None)
+def _cached_top_sales(filename, n, _size, _mtime):
+    """
+    Loads top n products from the on-disk cache or computes them
+
+    filename must be absolute. The _size and _mtime arguments are part of
+    the cache key so a modified file is always re-read.
+    """
+    # Hash the full path so same-named files in different directories
+    # get separate entries
+    path_hash = hashlib.sha1(filename.encode('utf-8')).hexdigest()[:16]
+    cache_prefix = f"{os.path.basename(filename)}.{path_hash}."
+    cache_suffix = f".{_size}.{_mtime}.v{CACHE_VERSION}.pkl"
+    cache_file = os.path.join(CACHE_DIR, f"{cache_prefix}{n}{cache_suffix}")
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    transactions = load_transactions(filename)
+    products = top_selling_products(transactions, n=n)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(products, f)
+
+        # Entries for an older size, mtime or CACHE_VERSION of this file
+        # will never be read again
+        for stale_file in glob.glob(os.path.join(glob.escape(CACHE_DIR),
+                                                 glob.escape(cache_prefix) + '*.pkl')):
+            if not stale_file.endswith(cache_suffix):
+                os.remove(stale_file)
+    except OSError:
+        # Caching is best effort only
+        pass
+
+    return products
+
+
+def top_sales(filename, n=1000):
+    """
+    Returns top n products for a sales file, reusing cached results
+
+    Args:
+        filename (str): Path to the sales data file
+        n (int): Number of products to return
+
+    Returns: list of tuples (ProductName, TotalQuantity, TotalRevenue)
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Error: File '{filename}' not found.")
+
+    # Return a copy so callers can't mutate the cached list
+    return list(_cached_top_sales(os.path.abspath(filename), n,
+                                  stat.st_size, stat.st_mtime))
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from parse_transactions import load_transactions
+from read_sales_data import read_sales_data
+
+
+HEADER = b"TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n"
+
+
+class LoadTransactionsEncodingTest(unittest.TestCase):
+    def setUp(self):
+        self.filenames = []
+    
+    def tearDown(self):
+        for filename in self.filenames:
+            os.remove(filename)
+    
+    def write_sales_file(self, special_row, position):
+        """
+        Writes 200 valid UTF-8 rows with special_row inserted at position
+        """
+        rows = [b"T%03d|2024-12-01|P101|Laptop|2|45000|C001|North\n" % i for i in range(200)]
+        rows.insert(position, special_row)
+        
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        self.filenames.append(filename)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER + b''.join(rows))
+        
+        return filename
+    
+    def test_falls_back_on_undecodable_bytes_past_probe(self):
+        # 200 rows push the cp1252 row well past the 4 KiB probe
+        row = "T999|2024-12-02|P102|Café|1|500|C002|South\n".encode('cp1252')
+        filename = self.write_sales_file(row, 200)
+        transactions = load_transactions(filename)
+        
+        self.assertEqual(len(transactions), 201)
+        self.assertEqual(len(transactions), len(read_sales_data(filename)))
+        self.assertEqual(transactions[-1]['ProductName'], 'Café')
+        self.assertEqual(transactions[0]['Quantity'], 2)
+    
+    def test_same_byte_decodes_the_same_wherever_it_sits(self):
+        row = b"T999|2024-12-02|P102|Mouse \x80|1|500|C002|South\n"
+        
+        for position in (0, 200):
+            with self.subTest(position=position):
+                filename = self.write_sales_file(row, position)
+                names = [t['ProductName'] for t in load_transactions(filename)]
+                
+                self.assertEqual(names[position], 'Mouse €')
+                self.assertIn('Mouse €', read_sales_data(filename)[position])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,9 @@
+from heapq import nlargest
+from operator import itemgetter
+
+from sales_aggregation import sum_by_group
+
+
 def top_selling_products(transactions, n=5):
     """
     Finds top n products by total quantity sold
@@ -19,39 +25,27 @@ def top_selling_products(transactions, n=5):
     - Return top n products
     """
     
-    product_stats = {}
-    
-    # Aggregate product data
-    for transaction in transactions:
-        product_name = transaction['ProductName']
-        quantity = transaction['Quantity']
-        revenue = quantity * transaction['UnitPrice']
-        
-        if product_name not in product_stats:
-            product_stats[product_name] = {
-                'total_quantity': 0,
-                'total_revenue': 0.0,
-                'transaction_count': 0
-            }
-        
-        product_stats[product_name]['total_quantity'] += quantity
-        product_stats[product_name]['total_revenue'] += revenue
-        product_stats[product_name]['transaction_count'] += 1
+    product_stats = sum_by_group(transactions, 'ProductName')
     
     # Convert to list of tuples and sort by total quantity descending
     product_list = [
-        (product_name, stats['total_quantity'], stats['total_revenue'])
-        for product_name, stats in product_stats.items()
+        (product_name, total_quantity, total_revenue)
+        for product_name, (total_quantity, total_revenue, _) in product_stats.items()
     ]
     
-    product_list.sort(key=lambda x: x[1], reverse=True)
+    # Select top n with a bounded heap when only a few are wanted;
+    # nlargest keeps the same tie order as a stable descending sort
+    if n < len(product_list):
+        return nlargest(n, product_list, key=itemgetter(1))
+    
+    product_list.sort(key=itemgetter(1), reverse=True)
     
-    # Return top n products
-    return product_list[:n]
+    return product_list
 
 
 # Test the function
 if __name__ == "__main__":
+    from itertools import accumulate
     from read_sales_data import read_sales_data
     from parse_transactions import parse_transactions
     
@@ -64,8 +58,11 @@ if __name__ == "__main__":
         
         print(f"Total transactions: {len(transactions)}\n")
         
+        # Rank all products once; every top-n view below is a slice of it
+        all_products = top_selling_products(transactions, n=1000)
+        
         # Get top 5 selling products
-        top_products = top_selling_products(transactions, n=5)
+        top_products = all_products[:5]
         
         print("="*80)
         print("TOP 5 SELLING PRODUCTS (BY QUANTITY)")
@@ -77,15 +74,18 @@ if __name__ == "__main__":
         for i, (product_name, quantity, revenue) in enumerate(top_products, 1):
             print(f"{i:<6} {product_name:<30} {quantity:<15} ${revenue:>17,.2f}")
         
-        # Get all products statistics
-        all_products = top_selling_products(transactions, n=1000)
-        
+        # All products statistics
         print("\n" + "="*80)
         print("ALL PRODUCTS STATISTICS")
         print("="*80)
         
-        total_quantity = sum(qty for _, qty, _ in all_products)
-        total_revenue = sum(rev for _, _, rev in all_products)
+        # Running totals over the ranked list; the overall totals and every
+        # top-n cutoff below are lookups into these instead of new scans
+        cumulative_quantities = list(accumulate(map(itemgetter(1), all_products)))
+        cumulative_revenues = list(accumulate(map(itemgetter(2), all_products)))
+        
+        total_quantity = cumulative_quantities[-1] if all_products else 0
+        total_revenue = cumulative_revenues[-1] if all_products else 0
         
         print(f"\nTotal unique products: {len(all_products)}")
         print(f"Total quantity sold: {total_quantity:,} units")
@@ -96,7 +96,7 @@ if __name__ == "__main__":
         print("DETAILED ANALYSIS - TOP 10 PRODUCTS")
         print("="*80)
         
-        top_10 = top_selling_products(transactions, n=10)
+        top_10 = all_products[:10]
         
         print(f"\n{'Rank':<6} {'Product Name':<30} {'Qty':<10} {'Revenue':<20} {'Avg Price':<15}")
         print("-"*80)
@@ -110,16 +110,13 @@ if __name__ == "__main__":
         print("CUMULATIVE REVENUE ANALYSIS")
         print("="*80)
         
-        cumulative_revenue = 0
-        cumulative_quantity = 0
-        
         print(f"\n{'Top N':<8} {'Products':<15} {'Quantity':<15} {'Revenue':<20} {'% of Total':<12}")
         print("-"*80)
         
         for n_products in [1, 3, 5, 10, len(all_products)]:
-            top_n = top_selling_products(transactions, n=n_products)
-            cumulative_qty = sum(qty for _, qty, _ in top_n)
-            cumulative_rev = sum(rev for _, _, rev in top_n)
+            last = min(n_products, len(all_products)) - 1
+            cumulative_qty = cumulative_quantities[last]
+            cumulative_rev = cumulative_revenues[last]
             percentage = (cumulative_rev / total_revenue) * 100
             
             print(f"{n_products:<8} {n_products:<15} {cumulative_qty:<15} ${cumulative_rev:>17,.2f} {percentage:>10.2f}%")
@@ -1,4 +1,61 @@
-def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None):
+from operator import itemgetter
+
+
+def validate_transactions(transactions):
+    """
+    Runs the validation pass of validate_and_filter
+
+    Call this once and pass the result to validate_and_filter(validation=...)
+    to apply several filters without re-validating the same transactions.
+
+    Returns: tuple (valid_transactions, invalid_count, regions_found, amount_range)
+    where amount_range is (min_amount, max_amount), or None if nothing is valid
+    """
+    
+    required_fields = frozenset(['TransactionID', 'Date', 'ProductID', 'ProductName',
+                                 'Quantity', 'UnitPrice', 'CustomerID', 'Region'])
+    
+    # Fetch every validated field with one C-level call per row
+    get_checked_fields = itemgetter('TransactionID', 'ProductID', 'CustomerID',
+                                    'Quantity', 'UnitPrice', 'Region')
+    
+    valid_transactions = []
+    invalid_count = 0
+    regions_found = set()
+    # Running amount range instead of a list of every amount
+    min_trans_amount = float('inf')
+    max_trans_amount = float('-inf')
+    
+    # First pass: validate all transactions
+    for trans in transactions:
+        # Check all required fields present (set comparison on the key view)
+        if not trans.keys() >= required_fields:
+            invalid_count += 1
+            continue
+        
+        transaction_id, product_id, customer_id, quantity, unit_price, region = get_checked_fields(trans)
+        
+        # IDs must start with 'T', 'P' and 'C'; Quantity and UnitPrice must be > 0.
+        # A one-character slice compare is cheaper than a startswith() call
+        if (transaction_id[:1] == 'T' and product_id[:1] == 'P' and
+                customer_id[:1] == 'C' and quantity > 0 and unit_price > 0):
+            valid_transactions.append(trans)
+            regions_found.add(region)
+            amount = quantity * unit_price
+            if amount < min_trans_amount:
+                min_trans_amount = amount
+            if amount > max_trans_amount:
+                max_trans_amount = amount
+        else:
+            invalid_count += 1
+    
+    amount_range = (min_trans_amount, max_trans_amount) if valid_transactions else None
+    
+    return valid_transactions, invalid_count, regions_found, amount_range
+
+
+def validate_and_filter(transactions, region=None, min_amount=None, max_amount=None,
+                        validation=None):
     """
     Validates transactions and applies optional filters
 
@@ -7,6 +64,7 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     - region: filter by specific region (optional)
     - min_amount: minimum transaction amount (Quantity * UnitPrice) (optional)
     - max_amount: maximum transaction amount (optional)
+    - validation: result of validate_transactions(transactions) to reuse (optional)
 
     Returns: tuple (valid_transactions, invalid_count, filter_summary)
 
@@ -37,49 +95,11 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     - Show count of records after each filter applied
     """
     
-    required_fields = ['TransactionID', 'Date', 'ProductID', 'ProductName',
-                       'Quantity', 'UnitPrice', 'CustomerID', 'Region']
+    owns_validation = validation is None
+    if owns_validation:
+        validation = validate_transactions(transactions)
     
-    valid_transactions = []
-    invalid_count = 0
-    regions_found = set()
-    amounts = []
-    
-    # First pass: validate all transactions
-    for trans in transactions:
-        is_valid = True
-        
-        # Check all required fields present
-        if not all(field in trans for field in required_fields):
-            is_valid = False
-        
-        # Validate TransactionID starts with 'T'
-        elif not trans['TransactionID'].startswith('T'):
-            is_valid = False
-        
-        # Validate ProductID starts with 'P'
-        elif not trans['ProductID'].startswith('P'):
-            is_valid = False
-        
-        # Validate CustomerID starts with 'C'
-        elif not trans['CustomerID'].startswith('C'):
-            is_valid = False
-        
-        # Validate Quantity > 0
-        elif trans['Quantity'] <= 0:
-            is_valid = False
-        
-        # Validate UnitPrice > 0
-        elif trans['UnitPrice'] <= 0:
-            is_valid = False
-        
-        if is_valid:
-            valid_transactions.append(trans)
-            regions_found.add(trans['Region'])
-            amount = trans['Quantity'] * trans['UnitPrice']
-            amounts.append(amount)
-        else:
-            invalid_count += 1
+    valid_transactions, invalid_count, regions_found, amount_range = validation
     
     # Print available regions and amount range
     print("=" * 60)
@@ -87,39 +107,55 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     for r in sorted(regions_found):
         print(f"  - {r}")
     
-    if amounts:
-        min_trans_amount = min(amounts)
-        max_trans_amount = max(amounts)
+    if amount_range is not None:
+        min_trans_amount, max_trans_amount = amount_range
         print(f"\nTRANSACTION AMOUNT RANGE:")
         print(f"  Minimum: ${min_trans_amount:,.2f}")
         print(f"  Maximum: ${max_trans_amount:,.2f}")
     print("=" * 60)
     
     # Apply filters
-    filtered_transactions = valid_transactions[:]
     filtered_by_region = 0
     filtered_by_amount = 0
     
-    # Filter by region
     if region is not None:
         region = region.strip()
-        before_region = len(filtered_transactions)
-        filtered_transactions = [t for t in filtered_transactions if t['Region'] == region]
-        filtered_by_region = before_region - len(filtered_transactions)
-        print(f"\nAfter region filter ('{region}'): {len(filtered_transactions)} records")
-    
-    # Filter by amount range
-    if min_amount is not None or max_amount is not None:
-        before_amount = len(filtered_transactions)
-        
-        filtered_transactions = [
-            t for t in filtered_transactions
-            if (min_amount is None or t['Quantity'] * t['UnitPrice'] >= min_amount) and
-               (max_amount is None or t['Quantity'] * t['UnitPrice'] <= max_amount)
-        ]
-        
-        filtered_by_amount = before_amount - len(filtered_transactions)
-        
+    filter_by_amount = min_amount is not None or max_amount is not None
+    
+    if region is None and not filter_by_amount:
+        # Nothing to filter; a reused validation result must not be handed
+        # out (and mutated) as the caller's own list
+        filtered_transactions = valid_transactions if owns_validation else valid_transactions[:]
+    else:
+        # Missing bounds become infinities, so the amount check is one
+        # chained comparison with no per-row None tests
+        lower = min_amount if min_amount is not None else float('-inf')
+        upper = max_amount if max_amount is not None else float('inf')
+        
+        # One loop specialized per filter combination, decided once here
+        if not filter_by_amount:
+            filtered_transactions = [t for t in valid_transactions if t['Region'] == region]
+            filtered_by_region = len(valid_transactions) - len(filtered_transactions)
+        elif region is None:
+            filtered_transactions = [t for t in valid_transactions
+                                     if lower <= t['Quantity'] * t['UnitPrice'] <= upper]
+            filtered_by_amount = len(valid_transactions) - len(filtered_transactions)
+        else:
+            # Region and amount predicates in a single pass over the valid rows
+            filtered_transactions = []
+            append = filtered_transactions.append
+            for t in valid_transactions:
+                if t['Region'] != region:
+                    filtered_by_region += 1
+                elif lower <= t['Quantity'] * t['UnitPrice'] <= upper:
+                    append(t)
+                else:
+                    filtered_by_amount += 1
+    
+    if region is not None:
+        print(f"\nAfter region filter ('{region}'): {len(valid_transactions) - filtered_by_region} records")
+    
+    if filter_by_amount:
         if min_amount is not None and max_amount is not None:
             print(f"After amount filter (${min_amount:,.2f} - ${max_amount:,.2f}): {len(filtered_transactions)} records")
         elif min_amount is not None:
@@ -154,11 +190,14 @@ if __name__ == "__main__":
         
         print(f"Total transactions loaded: {len(transactions)}\n")
         
+        # Validate once and reuse the result for every filter below
+        validation = validate_transactions(transactions)
+        
         # Test 1: Validate without filters
         print("\n" + "="*60)
         print("TEST 1: Validation only (no filters)")
         print("="*60)
-        valid, invalid, summary = validate_and_filter(transactions)
+        valid, invalid, summary = validate_and_filter(transactions, validation=validation)
         
         print(f"\nValidation Summary:")
         for key, value in summary.items():
@@ -168,7 +207,7 @@ if __name__ == "__main__":
         print("\n\n" + "="*60)
         print("TEST 2: Filter by region 'North'")
         print("="*60)
-        valid, invalid, summary = validate_and_filter(transactions, region='North')
+        valid, invalid, summary = validate_and_filter(transactions, region='North', validation=validation)
         
         print(f"\nFilter Summary:")
         for key, value in summary.items():
@@ -183,7 +222,8 @@ if __name__ == "__main__":
         print("\n\n" + "="*60)
         print("TEST 3: Filter by amount range ($5000 - $50000)")
         print("="*60)
-        valid, invalid, summary = validate_and_filter(transactions, min_amount=5000, max_amount=50000)
+        valid, invalid, summary = validate_and_filter(transactions, min_amount=5000, max_amount=50000,
+                                                      validation=validation)
         
         print(f"\nFilter Summary:")
         for key, value in summary.items():